@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import re
 import subprocess
 import sys
+import threading
 import warnings
-from datetime import date, datetime, time, timedelta
-from typing import Callable, Dict, List, Optional, Tuple
+from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 warnings.filterwarnings(
     "ignore",
@@ -15,18 +25,66 @@ warnings.filterwarnings(
 )
 
 try:
-    from urllib3.exceptions import NotOpenSSLWarning
-except Exception:
-    NotOpenSSLWarning = None  # type: ignore
-else:
-    warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
-import requests
-from dateutil import tz
-from dateutil.relativedelta import relativedelta
-from ics import Calendar, Event
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 
-PlatformHandler = Callable[[int, int, Calendar, bool], bool]
+KOLKATA_TZ = ZoneInfo("Asia/Kolkata")
+
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+# Saturday of LeetCode Biweekly Contest 141; the series repeats every 14 days.
+LEETCODE_BIWEEKLY_ANCHOR = date(2024, 10, 12)
+
+CODEFORCES_API_URL = "https://codeforces.com/api/contest.list"
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "contest-automator"
+)
+CODEFORCES_CACHE_FILE = CACHE_DIR / "cf.json"
+# Cached responses are served as-is while fresh and revalidated once expired.
+# If revalidation fails, a copy up to MAX_STALE old is still used.
+CODEFORCES_CACHE_TTL = 30 * 60
+CODEFORCES_CACHE_MAX_STALE = 6 * 60 * 60
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# When several divisions start together, the event is named after the
+# first of Div. 2, 3, 4, 1 present in a contest name.
+DIVISION_PRIORITY = {"2": 0, "3": 1, "4": 2, "1": 3}
+DIVISION_PATTERN = re.compile(r"Div\. ([1-4])")
+
+# Optional contest fields shown in the event description, in display order.
+CODEFORCES_DESCRIPTION_FIELDS = (
+    ("Difficulty: ", "difficulty"),
+    ("City: ", "city"),
+    ("Country: ", "country"),
+    ("ICPC Region: ", "icpcRegion"),
+)
+
+
+PlatformHandler = Callable[[int, int, List[str], bool], bool]
+
+
+ICS_UTC_FORMAT = "%Y%m%dT%H%M%SZ"
+
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//contest-automator//contest-calendar//EN\r\n"
+)
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+VEVENT_TEMPLATE = (
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}\r\n"
+    "DTSTAMP:{dtstamp}\r\n"
+    "DTSTART:{dtstart}\r\n"
+    "DTEND:{dtend}\r\n"
+    "{details}"
+    "{alarm}"
+    "END:VEVENT\r\n"
+)
 
 
 SHORT_NAMES = {
@@ -94,7 +152,7 @@ def parse_platform_list(raw: str) -> List[str]:
     return selections
 
 
-def prompt_menu_choices(options: Dict[str, str]) -> List[str]:
+def prompt_menu_choices(options: Mapping[str, str]) -> List[str]:
     """Prompt the user to pick one or more keys from the provided options."""
     keys = list(options.keys())
     while True:
@@ -174,327 +232,482 @@ def prompt_positive_int(prompt: str, default: Optional[int] = None) -> int:
         return value
 
 
-def inject_alarms(ics_text: str, reminder_minutes: int) -> str:
-    alarm_block = (
-        "BEGIN:VALARM\n"
-        f"TRIGGER:-PT{reminder_minutes}M\n"
-        "ACTION:DISPLAY\n"
-        "DESCRIPTION:Contest reminder\n"
-        "END:VALARM"
+def log(message: str, *, quiet: bool = False, is_error: bool = False) -> None:
+    if quiet and not is_error:
+        return
+    target = sys.stderr if is_error else sys.stdout
+    print(message, file=target)
+
+
+def escape_ics_text(value: str) -> str:
+    """Escape a TEXT property value as required by RFC 5545."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_ics_line(line: str) -> str:
+    """Fold a content line into 75-octet segments and terminate it with CRLF."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    segments = []
+    start, limit = 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1  # never split a multi-byte UTF-8 sequence
+        segments.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines begin with a space
+    return "\r\n ".join(segments) + "\r\n"
+
+
+def render_event_details(name: str, description: str, url: Optional[str] = None) -> str:
+    """Render the SUMMARY, DESCRIPTION and optional URL lines of a VEVENT."""
+    details = fold_ics_line(f"SUMMARY:{escape_ics_text(name)}") + fold_ics_line(
+        f"DESCRIPTION:{escape_ics_text(description)}"
+    )
+    if url:
+        details += fold_ics_line(f"URL:{url}")
+    return details
+
+
+@lru_cache(maxsize=None)
+def alarm_block(reminder_minutes: int) -> str:
+    """Return the VALARM component for the given reminder lead time."""
+    return (
+        "BEGIN:VALARM\r\n"
+        f"TRIGGER:-PT{reminder_minutes}M\r\n"
+        "ACTION:DISPLAY\r\n"
+        "DESCRIPTION:Contest reminder\r\n"
+        "END:VALARM\r\n"
+    )
+
+
+def import_requests():
+    """Import requests on first use so offline-only platforms skip its import cost."""
+    try:
+        from urllib3.exceptions import NotOpenSSLWarning
+    except Exception:
+        pass
+    else:
+        warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
+    import requests
+
+    return requests
+
+
+@lru_cache(maxsize=1)
+def codeforces_session():
+    """Return a pooled session that retries transient Codeforces gateway errors."""
+    requests = import_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    session = requests.Session()
+    session.headers["User-Agent"] = "contest-automator/1.0"
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry),
+    )
+    return session
+
+
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def load_codeforces_cache() -> Optional[dict]:
+    """Return the cached Codeforces response, or None if it is missing or unreadable."""
+    try:
+        cached = json_loads(CODEFORCES_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or "payload" not in cached:
+        return None
+    return cached
+
+
+def save_codeforces_cache(
+    payload: dict, etag: Optional[str], last_modified: Optional[str], ttl: int
+) -> None:
+    """Persist a Codeforces response with its validators; failures are ignored."""
+    entry = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": datetime.now(timezone.utc).timestamp(),
+        "ttl": ttl,
+        "payload": payload,
+    }
+    temp_file = CODEFORCES_CACHE_FILE.with_name(
+        f"{CODEFORCES_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp"
     )
-    return ics_text.replace("END:VEVENT", f"{alarm_block}\nEND:VEVENT")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_file.write_bytes(json_dumps(entry))
+        os.replace(temp_file, CODEFORCES_CACHE_FILE)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
 
+def cache_ttl(cache_control: Optional[str]) -> int:
+    match = MAX_AGE_PATTERN.search(cache_control or "")
+    if match is None:
+        return CODEFORCES_CACHE_TTL
+    return min(int(match.group(1)), CODEFORCES_CACHE_MAX_STALE)
+
+
+def refresh_codeforces_payload(cached: Optional[dict]) -> dict:
+    """Download contest.list, revalidating any cached copy with a conditional GET."""
+    requests = import_requests()
+    session = codeforces_session()
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if etag := cached.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := cached.get("last_modified"):
+            headers["If-Modified-Since"] = last_modified
 
-def fetch_codeforces_contests(limit: Optional[int] = None) -> list:
-    api_url = "https://codeforces.com/api/contest.list"
     try:
-        response = requests.get(api_url, timeout=10)
+        response = session.get(CODEFORCES_API_URL, headers=headers, timeout=(3, 10))
+        if response.status_code == 304 and cached is not None:
+            save_codeforces_cache(
+                cached["payload"],
+                cached.get("etag"),
+                cached.get("last_modified"),
+                cache_ttl(response.headers.get("Cache-Control")),
+            )
+            return cached["payload"]
         response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
+        payload = json_loads(response.content)
+    except (requests.RequestException, ValueError) as exc:
         raise RuntimeError(f"Failed to contact Codeforces API: {exc}") from exc
 
     if payload.get("status") != "OK":
         raise RuntimeError("Unexpected response from Codeforces API.")
 
-    contests = payload.get("result", [])
-    upcoming_cf = [
-        contest
-        for contest in contests
-        if contest.get("phase") == "BEFORE"
-        and contest.get("type") == "CF"
-        and "startTimeSeconds" in contest
-    ]
-    if limit is None:
-        return upcoming_cf
-    return upcoming_cf[:limit]
+    save_codeforces_cache(
+        payload,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        cache_ttl(response.headers.get("Cache-Control")),
+    )
+    return payload
+
+
+@lru_cache(maxsize=1)
+def fetch_codeforces_payload() -> dict:
+    """Return contest.list, revalidating the disk cache once its TTL expires."""
+    cached = load_codeforces_cache()
+    if cached is None:
+        return refresh_codeforces_payload(None)
+
+    age = datetime.now(timezone.utc).timestamp() - cached.get("fetched_at", 0)
+    if 0 <= age < cached.get("ttl", CODEFORCES_CACHE_TTL):
+        return cached["payload"]
+    try:
+        return refresh_codeforces_payload(cached)
+    except RuntimeError:
+        if 0 <= age < CODEFORCES_CACHE_MAX_STALE:
+            return cached["payload"]
+        raise
+
+
+def fetch_codeforces_contests() -> Dict[int, List[dict]]:
+    """Return upcoming Codeforces rounds grouped by start timestamp."""
+    grouped: Dict[int, List[dict]] = {}
+    for contest in fetch_codeforces_payload().get("result", []):
+        start_ts = contest.get("startTimeSeconds")
+        if (
+            start_ts is not None
+            and contest.get("phase") == "BEFORE"
+            and contest.get("type") == "CF"
+        ):
+            grouped.setdefault(start_ts, []).append(contest)
+    return grouped
+
+
+def division_rank(name: str) -> int:
+    return min(
+        (DIVISION_PRIORITY[division] for division in DIVISION_PATTERN.findall(name)),
+        default=len(DIVISION_PRIORITY),
+    )
+
+
+def choose_primary(entries: List[dict]) -> Tuple[dict, List[dict]]:
+    """Pop the contest that headlines a time slot and return it with the rest."""
+    ranks = [division_rank(entry.get("name", "")) for entry in entries]
+    primary_index = ranks.index(min(ranks))
+    return entries.pop(primary_index), entries
 
 
 def handle_codeforces(
-    reminder_minutes: int, months_ahead: int, calendar: Calendar, quiet: bool = False
+    reminder_minutes: int, months_ahead: int, events: List[str], quiet: bool = False
 ) -> bool:
-    def log(message: str, is_error: bool = False) -> None:
-        if quiet and not is_error:
-            return
-        target = sys.stderr if is_error else sys.stdout
-        print(message, file=target)
-
     try:
-        contests = fetch_codeforces_contests()
+        grouped = fetch_codeforces_contests()
     except RuntimeError as error:
         log(str(error), is_error=True)
         return False
 
-    if not contests:
-        log("No upcoming Codeforces contests were found.")
+    if not grouped:
+        log("No upcoming Codeforces contests were found.", quiet=quiet)
         return False
 
-    local_timezone = tz.tzlocal()
-    cutoff_date = datetime.now(local_timezone).date() + relativedelta(months=+months_ahead)
+    cutoff_date = add_months(datetime.now(LOCAL_TZ).date(), months_ahead)
+    cutoff_ts = datetime.combine(
+        cutoff_date + timedelta(days=1), time(0), tzinfo=LOCAL_TZ
+    ).timestamp()
     events_added = False
-
-    grouped: Dict[int, List[dict]] = {}
-    for contest in contests:
-        start_ts = contest.get("startTimeSeconds")
-        if start_ts is None:
-            continue
-        grouped.setdefault(start_ts, []).append(contest)
-
-    def choose_primary(entries: List[dict]) -> dict:
-        preferred_order = ["Div. 2", "Div. 3", "Div. 4", "Div. 1"]
-        for keyword in preferred_order:
-            for entry in entries:
-                if keyword in entry.get("name", ""):
-                    return entry
-        return entries[0]
+    dtstamp = datetime.now(timezone.utc).strftime(ICS_UTC_FORMAT)
+    alarm = alarm_block(reminder_minutes)
 
     for start_ts, grouped_contests in sorted(grouped.items()):
-        primary = choose_primary(grouped_contests)
-        start_utc = datetime.fromtimestamp(start_ts, tz=tz.tzutc())
-        start_local = start_utc.astimezone(local_timezone)
-        if start_local.date() > cutoff_date:
-            continue
+        if start_ts >= cutoff_ts:
+            break
+        start_utc = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+        primary, others = choose_primary(grouped_contests)
         duration_seconds = primary.get("durationSeconds", 0)
         duration = timedelta(seconds=duration_seconds)
         primary_id = primary.get("id")
 
-        event = Event()
-        event.name = primary.get("name", "Codeforces Contest")
-        event.begin = start_local
-        event.duration = duration
-        event.url = f"https://codeforces.com/contest/{primary.get('id')}"
         if primary_id is not None:
-            event.uid = f"codeforces-{primary_id}@contest-calendar"
+            uid = f"codeforces-{primary_id}@contest-calendar"
         else:
-            fallback = start_local.strftime("%Y%m%dT%H%M%S")
-            event.uid = f"codeforces-{fallback}@contest-calendar"
-
-        description_lines = [
-            f"Type: {primary.get('kind', 'Codeforces Round')}",
-            f"Duration: {duration}",
+            start_local = start_utc.astimezone(LOCAL_TZ)
+            uid = f"codeforces-{start_local:%Y%m%dT%H%M%S}@contest-calendar"
+
+        parts = [
+            "Type: ",
+            str(primary.get("kind", "Codeforces Round")),
+            "\nDuration: ",
+            str(duration),
         ]
-
-        if difficulty := primary.get("difficulty"):
-            description_lines.append(f"Difficulty: {difficulty}")
-        if city := primary.get("city"):
-            description_lines.append(f"City: {city}")
-        if country := primary.get("country"):
-            description_lines.append(f"Country: {country}")
-        if icpc_region := primary.get("icpcRegion"):
-            description_lines.append(f"ICPC Region: {icpc_region}")
-
-        others = [c for c in grouped_contests if c is not primary]
+        for label, field in CODEFORCES_DESCRIPTION_FIELDS:
+            if value := primary.get(field):
+                parts.extend(("\n", label, str(value)))
         if others:
-            description_lines.append("Other divisions at the same time:")
+            parts.append("\nOther divisions at the same time:")
             for entry in others:
-                description_lines.append(f"- {entry.get('name', 'Unnamed contest')}")
-
-        event.description = "\n".join(description_lines)
-        calendar.events.add(event)
+                parts.extend(("\n- ", entry.get("name", "Unnamed contest")))
+
+        events.append(
+            VEVENT_TEMPLATE.format(
+                uid=uid,
+                dtstamp=dtstamp,
+                dtstart=start_utc.strftime(ICS_UTC_FORMAT),
+                dtend=(start_utc + duration).strftime(ICS_UTC_FORMAT),
+                details=render_event_details(
+                    primary.get("name", "Codeforces Contest"),
+                    "".join(parts),
+                    f"https://codeforces.com/contest/{primary.get('id')}",
+                ),
+                alarm=alarm,
+            )
+        )
         events_added = True
 
     if not events_added:
-        log("No Codeforces events to add to the calendar.")
+        log("No Codeforces events to add to the calendar.", quiet=quiet)
         return False
 
     return True
 
 
+def add_months(start: date, months: int) -> date:
+    """Shift a date by whole months, clamping the day to the target month's length."""
+    month_index = start.month - 1 + months
+    year = start.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(start.day, monthrange(year, month)[1]))
+
+
 def next_weekday(after_date: date, weekday: int) -> date:
-    days_ahead = (weekday - after_date.weekday()) % 7
-    if days_ahead == 0:
-        days_ahead = 7
-    return after_date + timedelta(days=days_ahead)
+    return after_date + timedelta(days=(weekday - after_date.weekday() - 1) % 7 + 1)
 
 
 def generate_weekly_events(
-    calendar: Calendar,
+    events: List[str],
     first_date: date,
     end_date: date,
-    timezone,
+    tz: tzinfo,
     start_time: time,
     duration: timedelta,
     name: str,
     description: str,
     uid_prefix: str,
-) -> None:
-    current_date = first_date
-    while current_date <= end_date:
-        start_dt = datetime.combine(current_date, start_time, tzinfo=timezone)
-        event = Event(
-            name=name,
-            begin=start_dt,
-            end=start_dt + duration,
-            description=description,
-        )
-        event.uid = (
-            f"{uid_prefix}-{start_dt.strftime('%Y%m%dT%H%M%S')}@contest-calendar"
+    reminder_minutes: int,
+    interval_days: int = 7,
+) -> int:
+    """Append one event per interval up to end_date and return how many were added."""
+    details = render_event_details(name, description)
+    dtstamp = datetime.now(timezone.utc).strftime(ICS_UTC_FORMAT)
+    alarm = alarm_block(reminder_minutes)
+    occurrences = range(first_date.toordinal(), end_date.toordinal() + 1, interval_days)
+    step = timedelta(days=interval_days)
+    start_dt = datetime.combine(first_date, start_time, tzinfo=tz)
+    for _ in occurrences:
+        start_utc = start_dt.astimezone(timezone.utc)
+        events.append(
+            VEVENT_TEMPLATE.format(
+                uid=f"{uid_prefix}-{start_dt:%Y%m%dT%H%M%S}@contest-calendar",
+                dtstamp=dtstamp,
+                dtstart=start_utc.strftime(ICS_UTC_FORMAT),
+                dtend=(start_utc + duration).strftime(ICS_UTC_FORMAT),
+                details=details,
+                alarm=alarm,
+            )
         )
-        calendar.events.add(event)
-        current_date += timedelta(days=7)
+        start_dt += step
+    return len(occurrences)
 
 
 def handle_codechef(
-    reminder_minutes: int, months_ahead: int, calendar: Calendar, quiet: bool = False
+    reminder_minutes: int, months_ahead: int, events: List[str], quiet: bool = False
 ) -> bool:
-    def log(message: str, is_error: bool = False) -> None:
-        if quiet and not is_error:
-            return
-        target = sys.stderr if is_error else sys.stdout
-        print(message, file=target)
-
-    timezone = tz.gettz("Asia/Kolkata")
-    if timezone is None:
-        log("Unable to load Asia/Kolkata timezone data.", is_error=True)
-        return False
-
-    today = datetime.now(timezone).date()
-    end_date = today + relativedelta(months=+months_ahead)
+    today = datetime.now(KOLKATA_TZ).date()
+    end_date = add_months(today, months_ahead)
     first_contest = next_weekday(today, 2)  # Wednesday
     if first_contest > end_date:
-        log("No contests fall within the provided range.")
+        log("No contests fall within the provided range.", quiet=quiet)
         return False
 
-    before_count = len(calendar.events)
-    generate_weekly_events(
-        calendar,
+    added = generate_weekly_events(
+        events,
         first_contest,
         end_date,
-        timezone,
+        KOLKATA_TZ,
         time(20, 0),
         timedelta(hours=2),
         "CodeChef Weekly Contest",
         "CodeChef weekly contest.",
         "codechef-weekly",
+        reminder_minutes,
     )
 
-    if len(calendar.events) == before_count:
-        log("No CodeChef contests were added to the calendar.")
+    if added == 0:
+        log("No CodeChef contests were added to the calendar.", quiet=quiet)
         return False
 
     return True
 
 
 def handle_atcoder(
-    reminder_minutes: int, months_ahead: int, calendar: Calendar, quiet: bool = False
+    reminder_minutes: int, months_ahead: int, events: List[str], quiet: bool = False
 ) -> bool:
-    def log(message: str, is_error: bool = False) -> None:
-        if quiet and not is_error:
-            return
-        target = sys.stderr if is_error else sys.stdout
-        print(message, file=target)
-
-    timezone = tz.gettz("Asia/Kolkata")
-    if timezone is None:
-        log("Unable to load Asia/Kolkata timezone data.", is_error=True)
-        return False
-
-    today = datetime.now(timezone).date()
-    end_date = today + relativedelta(months=+months_ahead)
+    today = datetime.now(KOLKATA_TZ).date()
+    end_date = add_months(today, months_ahead)
     first_contest = next_weekday(today, 5)  # Saturday
     if first_contest > end_date:
-        log("No contests fall within the provided range.")
+        log("No contests fall within the provided range.", quiet=quiet)
         return False
 
-    before_count = len(calendar.events)
-    generate_weekly_events(
-        calendar,
+    added = generate_weekly_events(
+        events,
         first_contest,
         end_date,
-        timezone,
+        KOLKATA_TZ,
         time(17, 30),
         timedelta(minutes=100),
         "AtCoder Beginner Contest",
         "Weekly AtCoder Beginner Contest.",
         "atcoder-beginner",
+        reminder_minutes,
     )
 
-    if len(calendar.events) == before_count:
-        log("No AtCoder contests were added to the calendar.")
+    if added == 0:
+        log("No AtCoder contests were added to the calendar.", quiet=quiet)
         return False
 
     return True
 
 
 def next_biweekly_anchor(today: date) -> date:
-    anchor = date(2024, 10, 11)
-    while anchor <= today:
-        anchor += timedelta(days=14)
-    return anchor
+    days = (today - LEETCODE_BIWEEKLY_ANCHOR).days
+    if days < 0:
+        return LEETCODE_BIWEEKLY_ANCHOR
+    return LEETCODE_BIWEEKLY_ANCHOR + timedelta(days=14 * (days // 14 + 1))
 
 
 def handle_leetcode(
-    reminder_minutes: int, months_ahead: int, calendar: Calendar, quiet: bool = False
+    reminder_minutes: int, months_ahead: int, events: List[str], quiet: bool = False
 ) -> bool:
-    def log(message: str, is_error: bool = False) -> None:
-        if quiet and not is_error:
-            return
-        target = sys.stderr if is_error else sys.stdout
-        print(message, file=target)
-
-    timezone = tz.gettz("Asia/Kolkata")
-    if timezone is None:
-        log("Unable to load Asia/Kolkata timezone data.", is_error=True)
-        return False
-
-    today = datetime.now(timezone).date()
-    end_date = today + relativedelta(months=+months_ahead)
+    today = datetime.now(KOLKATA_TZ).date()
+    end_date = add_months(today, months_ahead)
 
     first_weekly = next_weekday(today, 6)  # Sunday
     first_biweekly = next_biweekly_anchor(today)
-    before_count = len(calendar.events)
+    added = 0
 
     if first_weekly <= end_date:
-        generate_weekly_events(
-            calendar,
+        added += generate_weekly_events(
+            events,
             first_weekly,
             end_date,
-            timezone,
+            KOLKATA_TZ,
             time(8, 0),
             timedelta(minutes=90),
             "LeetCode Weekly Contest",
             "LeetCode Weekly Contest.",
             "leetcode-weekly",
+            reminder_minutes,
         )
 
     if first_biweekly <= end_date:
-        current = first_biweekly
-        while current <= end_date:
-            start_dt = datetime.combine(current, time(20, 0), tzinfo=timezone)
-            if start_dt.weekday() != 5:  # ensure Saturday
-                offset = (5 - start_dt.weekday()) % 7
-                start_dt += timedelta(days=offset)
-            event = Event(
-                name="LeetCode Biweekly Contest",
-                begin=start_dt,
-                end=start_dt + timedelta(minutes=90),
-                description="LeetCode Biweekly Contest.",
-            )
-            event.uid = (
-                f"leetcode-biweekly-{start_dt.strftime('%Y%m%dT%H%M%S')}@contest-calendar"
-            )
-            calendar.events.add(event)
-            current = current + timedelta(days=14)
+        added += generate_weekly_events(
+            events,
+            first_biweekly,
+            end_date,
+            KOLKATA_TZ,
+            time(20, 0),
+            timedelta(minutes=90),
+            "LeetCode Biweekly Contest",
+            "LeetCode Biweekly Contest.",
+            "leetcode-biweekly",
+            reminder_minutes,
+            interval_days=14,
+        )
 
-    if len(calendar.events) == before_count:
-        log("No LeetCode contests fall within the provided range.")
+    if added == 0:
+        log("No LeetCode contests fall within the provided range.", quiet=quiet)
         return False
 
     return True
 
 
-def main() -> None:
-    args = parse_cli_args()
-    quiet = args.quiet
-
-    platforms: Dict[str, Tuple[str, PlatformHandler]] = {
+PLATFORMS: Mapping[str, Tuple[str, PlatformHandler]] = MappingProxyType(
+    {
         "codeforces": ("Codeforces", handle_codeforces),
         "codechef": ("CodeChef", handle_codechef),
         "atcoder": ("AtCoder", handle_atcoder),
         "leetcode": ("LeetCode", handle_leetcode),
     }
+)
+
+PLATFORM_LABELS: Mapping[str, str] = MappingProxyType(
+    {key: label for key, (label, _) in PLATFORMS.items()}
+)
+
+
+def main() -> None:
+    args = parse_cli_args()
+    quiet = args.quiet
 
-    platform_labels = {key: label for key, (label, _) in platforms.items()}
     if args.platforms:
         try:
             selected_keys = parse_platform_list(args.platforms)
@@ -504,7 +717,7 @@ def main() -> None:
         if not selected_keys:
             print("No valid platforms were provided.", file=sys.stderr)
             sys.exit(1)
-        missing = [key for key in selected_keys if key not in platforms]
+        missing = [key for key in selected_keys if key not in PLATFORMS]
         if missing:
             print(
                 f"Unsupported platform(s) requested: {', '.join(missing)}",
@@ -512,7 +725,7 @@ def main() -> None:
             )
             sys.exit(1)
     else:
-        selected_keys = prompt_menu_choices(platform_labels)
+        selected_keys = prompt_menu_choices(PLATFORM_LABELS)
 
     if args.reminder is not None:
         if args.reminder < 0:
@@ -536,17 +749,29 @@ def main() -> None:
             default=6,
         )
 
-    aggregated_calendar = Calendar()
-    successful_platforms: List[str] = []
+    platform_events: Dict[str, List[str]] = {key: [] for key in selected_keys}
+    with ThreadPoolExecutor(max_workers=len(selected_keys)) as executor:
+        futures = {}
+        for key in selected_keys:
+            label, handler = PLATFORMS[key]
+            if not quiet:
+                print(f"Processing {label} schedule…")
+            futures[key] = executor.submit(
+                handler,
+                reminder_minutes,
+                months_ahead,
+                platform_events[key],
+                quiet=quiet,
+            )
 
+    calendar_events: List[str] = []
+    successful_platforms: List[str] = []
     for key in selected_keys:
-        label, handler = platforms[key]
-        if not quiet:
-            print(f"Processing {label} schedule…")
-        if handler(reminder_minutes, months_ahead, aggregated_calendar, quiet=quiet):
+        if futures[key].result():
             successful_platforms.append(key)
+        calendar_events.extend(platform_events[key])
 
-    if not aggregated_calendar.events:
+    if not calendar_events:
         if not quiet:
             print("No contests were added for the selected platforms.")
         return
@@ -556,14 +781,16 @@ def main() -> None:
     if args.output:
         filename = args.output
     else:
-        today_str = datetime.now(tz.tzlocal()).date().isoformat()
+        today_str = datetime.now(LOCAL_TZ).date().isoformat()
         filename = f"{today_str}_{platform_suffix}.ics"
 
-    ics_text = inject_alarms(aggregated_calendar.serialize(), reminder_minutes)
-
     try:
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(ics_text)
+        with open(
+            filename, "w", encoding="utf-8", newline="", buffering=1 << 16
+        ) as file:
+            file.write(CALENDAR_HEADER)
+            file.writelines(calendar_events)
+            file.write(CALENDAR_FOOTER)
     except OSError as error:
         print(f"Failed to write {filename}: {error}", file=sys.stderr)
         return